@@ -25,6 +25,9 @@ Modifications (2025-08-04) :
   * ``format_article_markdown`` invoque ``unify_link_suffixes`` sur chaque ligne
     avant de l’ajouter au Markdown, garantissant que la conversion complète et
     les fichiers découpés conservent la même présentation.
+  * ``convert_full_document`` écrit le Markdown article par article lorsqu’un
+    ``output_file_path`` est fourni et renvoie alors ``None`` ; le Markdown n’est
+    renvoyé sous forme de chaîne que si aucun chemin n’est donné.
 
 V13 - Clean : NO display of notes.
 """
@@ -37,11 +40,19 @@ except Exception:
     filedialog = None
     messagebox = None
 
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from lxml import etree as ET
 from datetime import datetime
-from typing import Dict, Optional, Union, List, Tuple
+from typing import Callable, DefaultDict, Dict, Iterable, Iterator, Optional, TextIO, Union, List, Tuple
+import io
+import os
+import queue
 import re
+import threading
 
 CONFIG: Dict[str, Union[str, int]] = {
     'article_prefix': 'Art.',
@@ -49,11 +60,184 @@ CONFIG: Dict[str, Union[str, int]] = {
     'margin_separator': ' << ',
     'output_encoding': 'utf-8',
     'suffix_counter': 1,
+    # Number of worker processes used by convert_full_document (1 = in-process).
+    'workers': 1,
 }
 
 AKN_NS = 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0'
 FEDLEX_NS = 'http://www.fedlex.admin.ch/eli/cc/27/317_321_377/fr'
 
+# Namespace-qualified tag names, built once instead of on every lookup.
+AKN_NUM = f'{{{AKN_NS}}}num'
+AKN_P = f'{{{AKN_NS}}}p'
+AKN_AUTH = f'{{{AKN_NS}}}authorialNote'
+AKN_BLOCKLIST = f'{{{AKN_NS}}}blockList'
+AKN_LISTINTRO = f'{{{AKN_NS}}}listIntroduction'
+AKN_ITEM = f'{{{AKN_NS}}}item'
+AKN_PARAGRAPH = f'{{{AKN_NS}}}paragraph'
+AKN_CONTENT = f'{{{AKN_NS}}}content'
+AKN_HEADING = f'{{{AKN_NS}}}heading'
+AKN_LEVEL = f'{{{AKN_NS}}}level'
+AKN_ARTICLE = f'{{{AKN_NS}}}article'
+
+# Descendant search path for the articles, likewise built once.
+AKN_ARTICLE_PATH = f'.//{AKN_ARTICLE}'
+
+# Compiled XPath queries for the descendant lookups done for every article.
+NS = {'akn': AKN_NS}
+_XP_HEADING = ET.XPath('(.//akn:heading)[1]', namespaces=NS)
+_XP_CONTENT = ET.XPath('(.//akn:content)[1]', namespaces=NS)
+
+_ORDINAL_SUFFIXES = r"bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies"
+
+# Regular expressions used on every article are compiled once at import time.
+_ARTICLE_NUM_RE = re.compile(rf'(\d+)\s*([a-z])?\s*(?:({_ORDINAL_SUFFIXES}))?', re.IGNORECASE)
+_BASE_NUM_RE = re.compile(r'(\d+[a-z]?)', re.IGNORECASE)
+_TITLE_RE = re.compile(r'\*\*\[\[(Art\. ?\d+[a-zA-Z]* [^\]]*)\]\]\*\*')
+_FINAL_SECTION_RE = re.compile(r'Titre final|Dispositions finales|Dispositions transitoires')
+# Article number in a split title: digits, then either an ordinal suffix or a
+# letter optionally followed by one (titles write "268a bis", so a single space
+# may precede the suffix), then an optional "_n" index.  Unlike the former
+# ``[a-z]?...(?:quater|ter|bis)?[a-z]*`` there is a single way to assign the
+# letters, so a malformed title cannot make the engine backtrack.
+_NUM_MATCH_RE = re.compile(
+    rf'(\d+(?: ?(?:{_ORDINAL_SUFFIXES})|[a-z](?: ?(?:{_ORDINAL_SUFFIXES}))?)?(?:_\d+)?)'
+)
+_SUFFIX_RE = re.compile(rf'({_ORDINAL_SUFFIXES})')
+# Split-file naming as a transition table: the ordinal suffix found in the
+# article number gives the filename suffix and the suffix_counter after the
+# save.  _SUFFIX_TRANSITIONS holds the (suffix, counter) pairs that depend on
+# the previous article: a second "ter" in a row is the fourth of the series.
+_SUFFIX_TABLE: Dict[str, Tuple[str, int]] = {
+    '': ('', 1),
+    'bis': ('-2bis', 2), 'ter': ('-3ter', 3), 'quater': ('-4quater', 4),
+    'quinquies': ('-5quinquies', 5), 'sexies': ('-6sexies', 6),
+    'septies': ('-7septies', 7), 'octies': ('-8octies', 8),
+    'nonies': ('-9nonies', 9), 'decies': ('-10decies', 10),
+}
+_SUFFIX_TRANSITIONS: Dict[Tuple[str, int], Tuple[str, int]] = {
+    ('ter', 3): ('-4quater', 4),
+}
+# Ordinal added to a list enumeration that repeats within one blockList.
+_ENUM_SUFFIXES = {
+    2: 'bis', 3: 'ter', 4: 'quater', 5: 'quinquies',
+    6: 'sexies', 7: 'septies', 8: 'octies', 9: 'nonies',
+    10: 'decies', 11: 'undecies', 12: 'duodecies',
+}
+
+# Shared notes dict of the paragraph tuples.  Notes are collected per article
+# in extract_paragraphs' all_notes and never rendered, so the per-paragraph
+# dict is always empty and is only ever read: never mutate it.
+_EMPTY_NOTES: Dict[str, str] = {}
+
+# Paragraph indentation per nesting level, and the markup around the number of
+# a numbered line.
+_INDENTS = tuple("   " * level for level in range(16))
+_NUM_OPEN = '**<span style="color:yellow"><small>'
+_NUM_CLOSE = '</small></span>** '
+
+
+def _handle_inline_num(node: ET.Element, in_authorial: bool,
+                       parts: List[str], notes: Dict[str, str]) -> None:
+    # Numbers inside <p> are rendered separately; only the text after them is kept.
+    if not in_authorial and node.tail:
+        tail = node.tail.strip()
+        if tail:
+            parts.append(tail)
+
+
+def _handle_authorial_note(node: ET.Element, in_authorial: bool,
+                           parts: List[str], notes: Dict[str, str]) -> None:
+    # The note is recorded under a running per-article index but not rendered;
+    # its subtree is still walked so that any nested note is recorded too.
+    notes[str(len(notes) + 1)] = ' '.join(node.itertext()).strip()
+    _walk_inline(node, True, parts, notes)
+    if node.tail:
+        tail = node.tail.strip()
+        if tail:
+            parts.append(tail)
+
+
+# Handlers for the inline elements of a <p> that need special treatment.
+_INLINE_HANDLERS = {
+    AKN_NUM: _handle_inline_num,
+    AKN_AUTH: _handle_authorial_note,
+}
+
+
+def _walk_inline(node: ET.Element, in_authorial: bool,
+                 parts: List[str], notes: Dict[str, str]) -> None:
+    # Append the stripped text of node's descendants in document order (text,
+    # children, then tail), carrying down whether we are inside a note so each
+    # node is visited once.
+    for child in node:
+        handler = _INLINE_HANDLERS.get(child.tag)
+        if handler is not None:
+            handler(child, in_authorial, parts, notes)
+            continue
+        if not in_authorial and child.text:
+            txt = child.text.strip()
+            if txt:
+                parts.append(txt)
+        _walk_inline(child, in_authorial, parts, notes)
+        if not in_authorial and child.tail:
+            tail = child.tail.strip()
+            if tail:
+                parts.append(tail)
+
+
+def _split_item(item: ET.Element) -> Tuple[Optional[ET.Element], List[ET.Element], List[ET.Element]]:
+    # One pass over an <item>'s children: its first <num>, its <p> elements and
+    # its nested <blockList> elements, in document order.
+    num_elem: Optional[ET.Element] = None
+    p_elems: List[ET.Element] = []
+    block_lists: List[ET.Element] = []
+    for child in item:
+        ctag = child.tag
+        if ctag == AKN_P:
+            p_elems.append(child)
+        elif ctag == AKN_BLOCKLIST:
+            block_lists.append(child)
+        elif ctag == AKN_NUM and num_elem is None:
+            num_elem = child
+    return num_elem, p_elems, block_lists
+
+
+def _pick_paragraph_parts(para: ET.Element) -> Tuple[Optional[ET.Element], Optional[ET.Element]]:
+    # One pass over a <paragraph>'s children for its <num> and <content>.  The
+    # number must be a direct child (a deeper one belongs to a list item); the
+    # content normally is, and is searched deeper only when it is not.
+    num_elem: Optional[ET.Element] = None
+    content: Optional[ET.Element] = None
+    for child in para:
+        ctag = child.tag
+        if ctag == AKN_NUM:
+            if num_elem is None:
+                num_elem = child
+                if content is not None:
+                    break
+        elif ctag == AKN_CONTENT and content is None:
+            content = child
+            if num_elem is not None:
+                break
+    if content is None:
+        hits = _XP_CONTENT(para)
+        content = hits[0] if hits else None
+    return num_elem, content
+
+
+@lru_cache(maxsize=2048)
+def _compute_suffix(article_num: str, counter: int) -> Tuple[str, int]:
+    # File name of a split article and the suffix counter once it is saved.
+    m = _SUFFIX_RE.search(article_num)
+    suffix_word = m.group(1) if m else ''
+    file_suffix, next_counter = (_SUFFIX_TRANSITIONS.get((suffix_word, counter))
+                                 or _SUFFIX_TABLE[suffix_word])
+    base_match = _BASE_NUM_RE.match(article_num[:m.start()] if m else article_num)
+    if not base_match:
+        return article_num, next_counter
+    return f"{base_match.group(1)}{file_suffix}", next_counter
+
 
 class SwissCodeConverter:
     """Core converter class for transforming Akoma Ntoso XML into Markdown."""
@@ -63,19 +247,52 @@ class SwissCodeConverter:
         self.ns = {'akn': AKN_NS, 'fedlex': FEDLEX_NS}
         self.in_final_section: bool = False
         self.suffix_counter: int = int(self.config.get('suffix_counter', 1))
+        # Heading chain (outermost first) and final-section flag of each element
+        # above an article in the current document, shared by sibling articles.
+        self._hierarchies: Dict[ET.Element, Tuple[Tuple[str, ...], bool]] = {}
+        # Articles of the last file used in single mode, by normalised number:
+        # (article, number, marginal notes, in_final_section).  _indexed_file
+        # holds the path and modification time the index was built from.
+        self._article_index: Dict[str, Tuple[ET.Element, str, str, bool]] = {}
+        self._indexed_file: Optional[Tuple[str, int]] = None
 
     def parse_xml(self, xml_file_path: Union[str, Path]) -> ET.Element:
         parser = ET.XMLParser(remove_blank_text=True)
         tree = ET.parse(str(xml_file_path), parser)
         return tree.getroot()
 
+    def iter_articles(self, xml_file_path: Union[str, Path]) -> Iterator[ET.Element]:
+        # Stream the <article> elements so only the current article is fully
+        # materialised.  The enclosing <level> elements (and their headings) are
+        # kept because extract_marginal_notes walks up to them; only the subtree
+        # of each finished article and its already converted article siblings
+        # are released.
+        context = ET.iterparse(str(xml_file_path), events=('end',),
+                               tag=AKN_ARTICLE, remove_blank_text=True)
+        for _, article in context:
+            yield article
+            article.clear()
+            parent = article.getparent()
+            previous = article.getprevious()
+            while previous is not None and previous.tag == AKN_ARTICLE:
+                parent.remove(previous)
+                previous = article.getprevious()
+
     def extract_article_number(self, article_element: ET.Element) -> str:
-        num_element = article_element.find(f'.//{{{AKN_NS}}}num')
+        # Only the article's own <num> (or its heading's) names it; a deep search
+        # could pick up the number of a list item inside the article instead.
+        num_element = article_element.find(AKN_NUM)
+        if num_element is None:
+            heading = article_element.find(AKN_HEADING)
+            if heading is not None:
+                num_element = heading.find(AKN_NUM)
         if num_element is not None:
-            num_text = ' '.join(''.join(num_element.itertext()).split())
-            suffixes = r"bis|ter|quater|quinquies|sexies|septies|octies|nonies|decies"
-            pattern = re.compile(rf'(\d+)\s*([a-z])?\s*(?:({suffixes}))?', re.IGNORECASE)
-            m = pattern.search(num_text)
+            if len(num_element):
+                raw = ''.join(num_element.itertext())
+            else:
+                raw = num_element.text or ''
+            num_text = ' '.join(raw.split())
+            m = _ARTICLE_NUM_RE.search(num_text)
             if m:
                 digits = m.group(1)
                 letter = m.group(2) or ''
@@ -85,187 +302,191 @@ class SwissCodeConverter:
         return ""
 
     def extract_marginal_notes(self, article_element: ET.Element) -> str:
-        hierarchy: List[str] = []
-        current: Optional[ET.Element] = article_element
-        while current is not None:
-            if current.tag == f'{{{AKN_NS}}}level':
-                heading = current.find(f'.//{{{AKN_NS}}}heading', namespaces=self.ns)
-                if heading is not None and heading.text:
-                    text = heading.text.strip()
-                    if any(keyword in text for keyword in [
-                        "Titre final",
-                        "Dispositions finales",
-                        "Dispositions transitoires"]):
-                        self.in_final_section = True
-                    hierarchy.insert(0, text)
-            current = current.getparent()
+        hierarchy, is_final = self._hierarchy_of(article_element.getparent())
+        if is_final:
+            self.in_final_section = True
         return self.config['margin_separator'].join(hierarchy) if hierarchy else ""
 
+    def _hierarchy_of(self, element: Optional[ET.Element]) -> Tuple[Tuple[str, ...], bool]:
+        # Walk up only to the nearest ancestor already resolved, then extend its
+        # chain downwards, caching every element on the way.
+        pending: List[ET.Element] = []
+        current = element
+        while current is not None and current not in self._hierarchies:
+            pending.append(current)
+            current = current.getparent()
+        hierarchy, is_final = self._hierarchies[current] if current is not None else ((), False)
+        for elem in reversed(pending):
+            if elem.tag == AKN_LEVEL:
+                text, final = self._read_level_heading(elem)
+                if text is not None:
+                    hierarchy += (text,)
+                    is_final = is_final or final
+            self._hierarchies[elem] = (hierarchy, is_final)
+        return hierarchy, is_final
+
+    @staticmethod
+    def _read_level_heading(level_element: ET.Element) -> Tuple[Optional[str], bool]:
+        # The heading is normally the level's own child; search deeper only
+        # when it is not.
+        heading = level_element.find(AKN_HEADING)
+        if heading is None:
+            hits = _XP_HEADING(level_element)
+            heading = hits[0] if hits else None
+        if heading is not None and heading.text:
+            text = heading.text.strip()
+            return text, _FINAL_SECTION_RE.search(text) is not None
+        return None, False
+
     def extract_paragraphs(self, article_element: ET.Element
                            ) -> Tuple[List[Tuple[str, str, Dict[str, str], int]], Dict[str, str]]:
         paragraphs: List[Tuple[str, str, Dict[str, str], int]] = []
         all_notes: Dict[str, str] = {}
-        note_counter = 0
+
+        def append_tail(node: ET.Element, level: int) -> None:
+            # A node's tail becomes an unnumbered line; .tail is read and
+            # stripped once.
+            tail = node.tail
+            if tail:
+                tail = tail.strip()
+                if tail:
+                    paragraphs.append(("", tail, _EMPTY_NOTES, level))
 
         def parse_element(elem: ET.Element, para_num: str = "", level: int = 0) -> None:
-            nonlocal note_counter, all_notes, paragraphs
+            nonlocal all_notes, paragraphs
             current_num = para_num
-            if elem.text and elem.text.strip():
-                intro_text = elem.text.strip()
-                paragraphs.append((current_num, intro_text, {}, level))
-                current_num = ""
+            intro_text = elem.text
+            if intro_text:
+                intro_text = intro_text.strip()
+                if intro_text:
+                    paragraphs.append((current_num, intro_text, _EMPTY_NOTES, level))
+                    current_num = ""
 
             def extract_p_text(p_elem: ET.Element) -> Tuple[str, Dict[str, str]]:
                 p_parts: List[str] = []
-                local_notes: Dict[str, str] = {}
-                nonlocal note_counter
-                for node in p_elem.iter():
-                    in_authorial = any(
-                        ancestor.tag == f'{{{AKN_NS}}}authorialNote'
-                        for ancestor in node.iterancestors()
-                    )
-                    if ET.QName(node).localname == 'num':
-                        if not in_authorial and node.tail:
-                            tail = node.tail.strip()
-                            if tail:
-                                p_parts.append(tail)
-                        continue
-                    if node.tag == f'{{{AKN_NS}}}authorialNote':
-                        note_text = ' '.join(node.itertext()).strip()
-                        note_counter += 1
-                        note_id = str(note_counter)
-                        all_notes[note_id] = note_text
-                        if node.tail:
-                            tail = node.tail.strip()
-                            if tail:
-                                p_parts.append(tail)
-                        continue
-                    if not in_authorial:
-                        if node is p_elem:
-                            if node.text:
-                                txt = node.text.strip()
-                                if txt:
-                                    p_parts.append(txt)
-                        else:
-                            if node.text:
-                                txt = node.text.strip()
-                                if txt:
-                                    p_parts.append(txt)
-                            if node.tail:
-                                tail = node.tail.strip()
-                                if tail:
-                                    p_parts.append(tail)
-                return ' '.join(filter(None, p_parts)).strip(), local_notes
+                local_notes = _EMPTY_NOTES
+                # Fast paths for the common cases: a <p> without children, and one
+                # without inline numbers or notes, whose text is simply every
+                # stripped text/tail piece in document order.
+                if not len(p_elem):
+                    return (p_elem.text or '').strip(), local_notes
+                if next(p_elem.iter(AKN_NUM, AKN_AUTH), None) is None:
+                    pieces = (t.strip() for t in p_elem.itertext())
+                    return ' '.join(t for t in pieces if t), local_notes
+                if p_elem.text:
+                    txt = p_elem.text.strip()
+                    if txt:
+                        p_parts.append(txt)
+                _walk_inline(p_elem, False, p_parts, all_notes)
+                return ' '.join(p_parts), local_notes
 
             def handle_block_list(bl_elem: ET.Element, lvl: int, num: str) -> None:
-                local_enum_counts: Dict[str, int] = {}
-                suffixes = {
-                    2: 'bis', 3: 'ter', 4: 'quater', 5: 'quinquies',
-                    6: 'sexies', 7: 'septies', 8: 'octies', 9: 'nonies',
-                    10: 'decies', 11: 'undecies', 12: 'duodecies',
-                }
+                local_enum_counts: DefaultDict[str, int] = defaultdict(int)
                 current_list_num = num
-                list_intro = bl_elem.find(f'{{{AKN_NS}}}listIntroduction')
+                # One pass over the list's children instead of a find per tag.
+                list_intro: Optional[ET.Element] = None
+                items: List[ET.Element] = []
+                for child in bl_elem:
+                    ctag = child.tag
+                    if ctag == AKN_ITEM:
+                        items.append(child)
+                    elif ctag == AKN_LISTINTRO and list_intro is None:
+                        list_intro = child
                 used_parent_num = False
-                if list_intro is not None and list_intro.text and list_intro.text.strip():
-                    intro_text = list_intro.text.strip()
+                intro_text = list_intro.text.strip() if list_intro is not None and list_intro.text else ""
+                if intro_text:
                     if current_list_num:
-                        paragraphs.append((current_list_num, intro_text, {}, lvl))
+                        paragraphs.append((current_list_num, intro_text, _EMPTY_NOTES, lvl))
                         used_parent_num = True
                         current_list_num = ""
                     else:
-                        paragraphs.append(("", intro_text, {}, lvl))
-                items = bl_elem.findall(f'{{{AKN_NS}}}item')
+                        paragraphs.append(("", intro_text, _EMPTY_NOTES, lvl))
                 if len(items) == 1:
                     itm = items[0]
-                    has_nested = itm.find(f'{{{AKN_NS}}}blockList') is not None
-                    if has_nested:
-                        for p_e in itm.findall(f'{{{AKN_NS}}}p'):
+                    _, item_ps, nested_bls = _split_item(itm)
+                    if nested_bls:
+                        for p_e in item_ps:
                             intro_txt, _ = extract_p_text(p_e)
                             if intro_txt:
                                 if current_list_num and not used_parent_num:
-                                    paragraphs.append((current_list_num, intro_txt, {}, lvl))
+                                    paragraphs.append((current_list_num, intro_txt, _EMPTY_NOTES, lvl))
                                     used_parent_num = True
                                     current_list_num = ""
                                 else:
-                                    paragraphs.append(("", intro_txt, {}, lvl))
-                        for nested_bl in itm.findall(f'{{{AKN_NS}}}blockList'):
+                                    paragraphs.append(("", intro_txt, _EMPTY_NOTES, lvl))
+                        for nested_bl in nested_bls:
                             handle_block_list(nested_bl, lvl + 1, "")
-                        if itm.tail and itm.tail.strip():
-                            paragraphs.append(("", itm.tail.strip(), {}, lvl + 1))
+                        append_tail(itm, lvl + 1)
                         return
                 for index, itm in enumerate(items):
-                    itm_num_elem = itm.find(f'{{{AKN_NS}}}num')
+                    itm_num_elem, item_ps, nested_bls = _split_item(itm)
                     itm_num = itm_num_elem.text.strip() if itm_num_elem is not None and itm_num_elem.text else ""
                     base_enum = itm_num.rstrip('.').strip()
                     display_enum = itm_num
                     if base_enum:
-                        count = local_enum_counts.get(base_enum, 0) + 1
+                        count = local_enum_counts[base_enum] + 1
                         local_enum_counts[base_enum] = count
                         if count > 1:
-                            suffix = suffixes.get(count, f"{count}")
+                            suffix = _ENUM_SUFFIXES.get(count, f"{count}")
                             display_enum = f"{base_enum} {suffix}."
                     else:
                         display_enum = ""
                     itm_text_parts: List[str] = []
-                    notes: Dict[str, str] = {}
-                    for p_e in itm.findall(f'{{{AKN_NS}}}p'):
+                    for p_e in item_ps:
                         txt, _ = extract_p_text(p_e)
                         if txt:
                             itm_text_parts.append(txt)
-                    item_text = ' '.join(filter(None, itm_text_parts)).strip()
+                    item_text = ' '.join(itm_text_parts)
                     if current_list_num and not used_parent_num:
-                        paragraphs.append((current_list_num, item_text, notes, lvl + 1))
+                        paragraphs.append((current_list_num, item_text, _EMPTY_NOTES, lvl + 1))
                         used_parent_num = True
                         current_list_num = ""
                     else:
-                        paragraphs.append((display_enum, item_text, notes, lvl + 1))
-                    for nested_bl in itm.findall(f'{{{AKN_NS}}}blockList'):
+                        paragraphs.append((display_enum, item_text, _EMPTY_NOTES, lvl + 1))
+                    for nested_bl in nested_bls:
                         handle_block_list(nested_bl, lvl + 1, "")
-                    if itm.tail and itm.tail.strip():
-                        paragraphs.append(("", itm.tail.strip(), {}, lvl + 1))
+                    append_tail(itm, lvl + 1)
 
             for child in elem:
-                ctag = ET.QName(child).localname
-                if ctag == 'blockList':
+                ctag = child.tag
+                if ctag == AKN_BLOCKLIST:
                     handle_block_list(child, level, current_num)
                     current_num = ""
-                    if child.tail and child.tail.strip():
-                        paragraphs.append(("", child.tail.strip(), {}, level))
-                elif ctag == 'p':
+                    append_tail(child, level)
+                elif ctag == AKN_P:
                     txt, local_notes = extract_p_text(child)
                     if txt:
                         paragraphs.append((current_num, txt, local_notes, level))
                         current_num = ""
-                    if child.tail and child.tail.strip():
-                        paragraphs.append(("", child.tail.strip(), {}, level))
+                    append_tail(child, level)
                 else:
                     parse_element(child, current_num, level)
                     current_num = ""
-            if elem.tail and elem.tail.strip():
-                paragraphs.append(("", elem.tail.strip(), {}, level))
+            append_tail(elem, level)
 
-        paragraph_elements = article_element.findall(f'.//{{{AKN_NS}}}paragraph')
+        # <paragraph> may also appear nested inside <content> or <subdivision>, so
+        # the whole subtree is walked.  Each paragraph's number and content are
+        # picked once; the numbered count is needed before the first paragraph
+        # is converted.
+        paragraph_parts: List[Tuple[str, Optional[ET.Element]]] = []
         numbered_count = 0
-        for p in paragraph_elements:
-            n_el = p.find(f'.//{{{AKN_NS}}}num')
-            if n_el is not None and n_el.text and n_el.text.strip():
-                numbered_count += 1
-        for para in paragraph_elements:
-            num_element = para.find(f'.//{{{AKN_NS}}}num')
+        for para in article_element.iter(AKN_PARAGRAPH):
+            num_element, content_element = _pick_paragraph_parts(para)
             para_num = num_element.text.strip() if num_element is not None and num_element.text else ""
-            content_element = para.find(f'.//{{{AKN_NS}}}content')
+            if para_num:
+                numbered_count += 1
+            paragraph_parts.append((para_num, content_element))
+        for para_num, content_element in paragraph_parts:
             if content_element is not None:
                 use_num = para_num
-                if numbered_count == 1 and para_num:
-                    has_direct_block_list = any(
-                        ET.QName(child).localname == 'blockList' for child in content_element
-                    )
-                    if has_direct_block_list:
-                        use_num = ""
+                # A lone numbered paragraph whose content holds a list is
+                # rendered without its number.
+                if (numbered_count == 1 and para_num
+                        and content_element.find(AKN_BLOCKLIST) is not None):
+                    use_num = ""
                 parse_element(content_element, use_num, level=0)
             else:
-                paragraphs.append((para_num, "", {}, 0))
+                paragraphs.append((para_num, "", _EMPTY_NOTES, 0))
         return paragraphs, all_notes
 
     # replace_article_references has been fully removed!
@@ -288,12 +509,11 @@ class SwissCodeConverter:
             markdown_lines.append(f"[{marginal_notes}]")
         markdown_lines.append("")
         for para_num, para_text, _notes, level in paragraphs:
-            indent = "   " * level
+            indent = _INDENTS[level] if level < len(_INDENTS) else "   " * level
             # ICI : suppression de replace_article_references, on garde le texte brut
             converted_text = para_text
             if para_num:
-                colored_num = f"<span style=\"color:yellow\"><small>{para_num}</small></span>"
-                line = f"{indent}**{colored_num}** {converted_text}"
+                line = ''.join((indent, _NUM_OPEN, para_num, _NUM_CLOSE, converted_text))
             else:
                 line = f"{indent}{converted_text}"
             unified_line = self.unify_link_suffixes(line)
@@ -301,105 +521,194 @@ class SwissCodeConverter:
         markdown_lines.append("")
         return "\n".join(markdown_lines)
 
+    def _reset_document_state(self) -> None:
+        # in_final_section is sticky within one document (the final title and
+        # transitional provisions close the code), but neither it nor the split
+        # suffix counter may leak into the next conversion run on this instance.
+        self.in_final_section = False
+        self.suffix_counter = int(self.config.get('suffix_counter', 1))
+        self._hierarchies.clear()
+
     def convert_article(self, article_element: ET.Element) -> str:
         article_number = self.extract_article_number(article_element)
         marginal_notes = self.extract_marginal_notes(article_element)
         paragraphs, notes = self.extract_paragraphs(article_element)
         return self.format_article_markdown(article_number, marginal_notes, paragraphs, notes)
 
+    def _render_articles(self, articles: Iterable[ET.Element]) -> Iterator[str]:
+        workers = int(self.config.get('workers', 1))
+        if workers <= 1:
+            for article in articles:
+                yield self.convert_article(article)
+            return
+        # The article number, the marginal notes and the sticky final-section
+        # flag depend on the enclosing document, so they are resolved here; the
+        # workers only receive the serialised article subtree.  Executor.map
+        # submits every task up front, so this mode trades the streaming memory
+        # bound for CPU parallelism.
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(self.config,)) as pool:
+            yield from pool.map(_convert_serialized_article,
+                                self._serialize_articles(articles),
+                                chunksize=32)
+
+    def _serialize_articles(self, articles: Iterable[ET.Element]
+                            ) -> Iterator[Tuple[bytes, str, str, bool]]:
+        for article in articles:
+            article_number = self.extract_article_number(article)
+            marginal_notes = self.extract_marginal_notes(article)
+            yield (ET.tostring(article, encoding='utf-8', with_tail=False),
+                   article_number, marginal_notes, self.in_final_section)
+
+    def convert_single_article(self,
+                               xml_file_path: Union[str, Path],
+                               article_num: str
+                               ) -> Optional[str]:
+        # Only the requested article is rendered.  The first lookup in a file
+        # indexes its articles; later lookups in the same unchanged file are a
+        # dict hit.
+        entry = self._index_articles(xml_file_path).get(article_num.replace(' ', '').lower())
+        if entry is None:
+            return None
+        return self._render_resolved_article(*entry)
+
+    def _index_articles(self, xml_file_path: Union[str, Path]
+                        ) -> Dict[str, Tuple[ET.Element, str, str, bool]]:
+        # The marginal notes and the sticky final-section flag are resolved in
+        # document order, so each entry renders as in a full conversion.  When
+        # a number occurs twice the first article wins.
+        key = (str(xml_file_path), Path(xml_file_path).stat().st_mtime_ns)
+        if self._indexed_file == key:
+            return self._article_index
+        self._reset_document_state()
+        self._article_index = {}
+        self._indexed_file = None
+        root = self.parse_xml(xml_file_path)
+        for article in root.iterfind(AKN_ARTICLE_PATH):
+            number = self.extract_article_number(article)
+            marginal_notes = self.extract_marginal_notes(article)
+            self._article_index.setdefault(number.replace(' ', '').lower(),
+                                           (article, number, marginal_notes, self.in_final_section))
+        self._indexed_file = key
+        return self._article_index
+
+    def _render_resolved_article(self, article: ET.Element, article_number: str,
+                                 marginal_notes: str, in_final_section: bool) -> str:
+        # Render an article whose document-dependent parts were resolved earlier.
+        self.in_final_section = in_final_section
+        paragraphs, notes = self.extract_paragraphs(article)
+        return self.format_article_markdown(article_number, marginal_notes, paragraphs, notes)
+
     def convert_full_document(self,
                               xml_file_path: Union[str, Path],
                               output_file_path: Optional[Union[str, Path]] = None
-                              ) -> str:
-        root = self.parse_xml(xml_file_path)
-        articles = root.findall(f'.//{{{AKN_NS}}}article')
-        if not articles:
-            raise ValueError("No articles found in the XML document")
-        markdown_content: List[str] = []
-        markdown_content.append(f"# {self.config['code_name']}")
-        markdown_content.append("")
-        markdown_content.append(f"*Converted from XML on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-        markdown_content.append("")
-        for article in articles:
-            article_markdown = self.convert_article(article)
-            markdown_content.append(article_markdown)
-        full_markdown = "\n".join(markdown_content)
+                              ) -> Optional[str]:
+        # With an output path the Markdown is streamed to the file article by
+        # article and None is returned; otherwise it is built in memory and
+        # returned.
+        articles = self._open_articles(xml_file_path)
         if output_file_path:
             with open(output_file_path, 'w', encoding=self.config['output_encoding']) as f:
-                f.write(full_markdown)
-        return full_markdown
+                self.write_markdown(articles, f)
+            return None
+        buffer = io.StringIO()
+        self.write_markdown(articles, buffer)
+        return buffer.getvalue()
+
+    def convert_and_split(self,
+                          xml_file_path: Union[str, Path],
+                          output_dir: Path,
+                          pattern: str
+                          ) -> Tuple[int, List[str]]:
+        # Same files as split_from_full_markdown(convert_full_document(...)), but
+        # each article is cut and written as soon as it is rendered, without
+        # building and re-scanning the full Markdown.
+        articles = self._open_articles(xml_file_path)
+        sections = self._iter_sections(self._render_articles(articles))
+        return self._write_split_files(sections, output_dir, pattern)
+
+    def _open_articles(self, xml_file_path: Union[str, Path]) -> Iterator[ET.Element]:
+        # Start a new document, failing early when it holds no article.
+        self._reset_document_state()
+        articles = self.iter_articles(xml_file_path)
+        first = next(articles, None)
+        if first is None:
+            raise ValueError("No articles found in the XML document")
+        return chain((first,), articles)
+
+    def write_markdown(self, articles: Iterable[ET.Element], out: TextIO) -> None:
+        out.write(f"# {self.config['code_name']}\n")
+        out.write("\n")
+        out.write(f"*Converted from XML on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n")
+        out.write("\n")
+        separator = ""
+        for article_markdown in self._render_articles(articles):
+            out.write(separator)
+            out.write(article_markdown)
+            separator = "\n"
 
     # Unchanged methods from the original script: suffix handling, splitting into individual files, etc.
     def get_filename_with_suffix(self, article_num: str) -> str:
-        base_match = re.match(r'(\d+[a-z]?)', article_num, re.IGNORECASE)
-        suffix = ""
-        if base_match:
-            base_num = base_match.group(1)
-        else:
-            return article_num
-        if "bis" in article_num:
-            suffix = "-2bis"
-        elif "ter" in article_num:
-            if self.suffix_counter == 2:
-                suffix = "-3ter"
-            elif self.suffix_counter == 3:
-                suffix = "-4quater"
-            else:
-                suffix = "-3ter"
-        elif "quater" in article_num:
-            suffix = "-4quater"
-        else:
-            suffix = ""
-        return f"{base_num}{suffix}"
+        return _compute_suffix(article_num, self.suffix_counter)[0]
 
     def update_counter_after_save(self, article_num: str) -> None:
-        if "bis" in article_num:
-            self.suffix_counter = 2
-        elif "ter" in article_num:
-            if self.suffix_counter == 2:
-                self.suffix_counter = 3
-            elif self.suffix_counter == 3:
-                self.suffix_counter = 4
-            else:
-                self.suffix_counter = 3
-        elif "quater" in article_num:
-            self.suffix_counter = 4
-        else:
-            self.suffix_counter = 1
+        self.suffix_counter = _compute_suffix(article_num, self.suffix_counter)[1]
 
     def split_from_full_markdown(self,
                                  full_markdown: str,
                                  output_dir: Path,
                                  pattern: str
                                  ) -> Tuple[int, List[str]]:
-        articles = re.findall(
-            r'(\*\*\[\[Art\. ?\d+[a-zA-Z]* [^\]]*\]\]\*\*.*?)(?=(\*\*\[\[Art\. ?\d+[a-zA-Z]* [^\]]*\]\]\*\*|$))',
-            full_markdown,
-            flags=re.S
-        )
+        self._reset_document_state()
+        return self._write_split_files(self._iter_sections((full_markdown,)),
+                                       output_dir, pattern)
+
+    @staticmethod
+    def _iter_sections(chunks: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        # Cut Markdown chunks, read as if joined by newlines, into (title,
+        # content) pairs: each article runs from its header up to the next one,
+        # and anything before the first header is dropped.  One linear scan over
+        # the headers of each chunk.
+        title: Optional[str] = None
+        pieces: List[str] = []
+        for chunk in chunks:
+            pos = 0
+            for match in _TITLE_RE.finditer(chunk):
+                if title is not None:
+                    pieces.append(chunk[pos:match.start()])
+                    yield title, '\n'.join(pieces).strip()
+                title = match.group(1)
+                pieces = []
+                pos = match.start()
+            if title is not None:
+                pieces.append(chunk[pos:])
+        if title is not None:
+            yield title, '\n'.join(pieces).strip()
+
+    def _write_split_files(self,
+                           sections: Iterable[Tuple[str, str]],
+                           output_dir: Path,
+                           pattern: str
+                           ) -> Tuple[int, List[str]]:
+        # Files are written in binary mode with one encoded payload each;
+        # creating them with 'x' replaces a separate exists() check, and the
+        # newline translation of text mode is applied by hand.
+        encoding = self.config['output_encoding']
         count = 0
         failed: List[str] = []
-        for art_content, _ in articles:
-            art_content = art_content.strip()
-            if not art_content:
-                continue
-            match = re.search(r'\*\*\[\[(.*?)\]\]\*\*', art_content)
-            if not match:
-                continue
-            article_title = match.group(1)
-            num_match = re.search(r'(\d+[a-z]?(?:_[\d]+)?(?:quater|ter|bis)?[a-z]*)', article_title)
+        for article_title, art_content in sections:
+            num_match = _NUM_MATCH_RE.search(article_title)
             if not num_match:
                 continue
             original_num = num_match.group(1)
             article_num = self.get_filename_with_suffix(original_num)
             filename = pattern.format(num=article_num) + ".md"
-            article_file = output_dir / filename
-            if article_file.exists():
-                failed.append(filename)
-                continue
+            if os.linesep != '\n':
+                art_content = art_content.replace('\n', os.linesep)
             try:
-                with open(article_file, 'w', encoding=self.config['output_encoding']) as f:
-                    f.write(art_content.strip())
+                with open(output_dir / filename, 'xb') as f:
+                    f.write(art_content.encode(encoding))
                 count += 1
                 self.update_counter_after_save(original_num)
             except Exception:
@@ -407,6 +716,20 @@ class SwissCodeConverter:
         return count, failed
 
 
+_worker_converter: Optional[SwissCodeConverter] = None
+
+
+def _init_worker(config: Dict[str, Union[str, int]]) -> None:
+    global _worker_converter
+    _worker_converter = SwissCodeConverter(config)
+
+
+def _convert_serialized_article(task: Tuple[bytes, str, str, bool]) -> str:
+    payload, article_number, marginal_notes, in_final_section = task
+    return _worker_converter._render_resolved_article(ET.fromstring(payload), article_number,
+                                                      marginal_notes, in_final_section)
+
+
 class SwissCodeGUI:
     """Simple GUI front-end for the SwissCodeConverter."""
 
@@ -439,7 +762,8 @@ class SwissCodeGUI:
         self.filename_pattern = tk.Entry(root, width=30)
         self.filename_pattern.insert(0, "{prefix} {num} {code}")
         self.filename_pattern.grid(row=6, column=1, sticky="w")
-        tk.Button(root, text="Lancer la conversion", command=self.run_conversion).grid(row=7, column=0, columnspan=3, pady=10)
+        self.run_button = tk.Button(root, text="Lancer la conversion", command=self.run_conversion)
+        self.run_button.grid(row=7, column=0, columnspan=3, pady=10)
 
     def browse_file(self) -> None:
         file_path = filedialog.askopenfilename(filetypes=[("XML files", "*.xml")])
@@ -453,46 +777,104 @@ class SwissCodeGUI:
             return
         self.config['article_prefix'] = self.prefix_entry.get().strip()
         self.config['code_name'] = self.code_entry.get().strip()
-        self.converter = SwissCodeConverter(self.config)
+        if self.converter.config != self.config:
+            self.converter = SwissCodeConverter(self.config)
+        # The dialogs run here on the Tk thread; the conversion itself runs in a
+        # worker thread so the window stays responsive, and its outcome is
+        # posted back through a queue polled with root.after.
+        job = self._prepare_job()
+        if job is None:
+            return
+        self.run_button.config(state="disabled")
+        results: "queue.Queue[Tuple[str, str, str]]" = queue.Queue()
+        threading.Thread(target=self._run_job, args=(job, results), daemon=True).start()
+        self.root.after(100, self._poll_job, results)
+
+    def _prepare_job(self) -> Optional[Callable[[], Tuple[str, str, str]]]:
+        # Ask for the destination and return the conversion to run, or None
+        # when the user cancels.  A job returns (level, title, message).
+        converter = self.converter
+        xml_file = self.xml_file
+        if self.choice.get() == "full":
+            save_path = filedialog.asksaveasfilename(defaultextension=".md",
+                                                     filetypes=[("Markdown files", "*.md")])
+            if not save_path:
+                return None
+
+            def job() -> Tuple[str, str, str]:
+                converter.convert_full_document(xml_file, save_path)
+                return "info", "Succès", f"Document complet converti : {save_path}"
+            return job
+        if self.choice.get() == "single":
+            art_num = self.article_entry.get().strip()
+            if not art_num:
+                messagebox.showerror("Erreur", "Veuillez indiquer le numéro d'article.")
+                return None
+            save_path = filedialog.asksaveasfilename(defaultextension=".md",
+                                                     filetypes=[("Markdown files", "*.md")])
+            if not save_path:
+                return None
+
+            def job() -> Tuple[str, str, str]:
+                article_markdown = converter.convert_single_article(xml_file, art_num)
+                if article_markdown is None:
+                    return "error", "Erreur", f"Article {art_num} introuvable."
+                with open(save_path, 'x', encoding="utf-8") as f:
+                    f.write(article_markdown)
+                return "info", "Succès", f"Article {art_num} converti : {save_path}"
+            return job
+        if self.choice.get() == "split":
+            output_dir = filedialog.askdirectory(title="Choisir le dossier de sortie")
+            if not output_dir:
+                return None
+            pattern = (self.filename_pattern.get()
+                       .replace("{prefix}", self.config['article_prefix'])
+                       .replace("{code}", self.config['code_name']))
+
+            def job() -> Tuple[str, str, str]:
+                count, failed = converter.convert_and_split(xml_file, Path(output_dir), pattern)
+                rapport = f"{count} articles enregistrés.\n"
+                if failed:
+                    # The dialog lists the first failures; the full list goes
+                    # to a new, timestamped log file next to the articles when
+                    # the folder can be written.
+                    rapport += "Échecs sur :\n" + "\n".join(failed[:20])
+                    if len(failed) > 20:
+                        rapport += f"\n… et {len(failed) - 20} autres"
+                    stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+                    log_path = Path(output_dir) / f"_failed-{stamp}.log"
+                    try:
+                        with open(log_path, 'x', encoding=converter.config['output_encoding']) as f:
+                            f.write("\n".join(failed) + "\n")
+                    except OSError:
+                        pass
+                    else:
+                        rapport += f"\nListe complète : {log_path}"
+                return "info", "Rapport", rapport
+            return job
+        return None
+
+    @staticmethod
+    def _run_job(job: Callable[[], Tuple[str, str, str]],
+                 results: "queue.Queue[Tuple[str, str, str]]") -> None:
         try:
-            if self.choice.get() == "full":
-                save_path = filedialog.asksaveasfilename(defaultextension=".md",
-                                                         filetypes=[("Markdown files", "*.md")])
-                if save_path:
-                    self.converter.convert_full_document(self.xml_file, save_path)
-                    messagebox.showinfo("Succès", f"Document complet converti : {save_path}")
-            elif self.choice.get() == "single":
-                art_num = self.article_entry.get().strip()
-                if not art_num:
-                    messagebox.showerror("Erreur", "Veuillez indiquer le numéro d'article.")
-                    return
-                save_path = filedialog.asksaveasfilename(defaultextension=".md",
-                                                         filetypes=[("Markdown files", "*.md")])
-                if save_path:
-                    full_markdown = self.converter.convert_full_document(self.xml_file)
-                    articles = re.findall(r'(\*\*\[\[.*?\]\]\*\*.*?)(?=\*\*\[\[.*?\]\]\*\*|$)', full_markdown, flags=re.S)
-                    for art in articles:
-                        if f"{self.config['article_prefix']} {art_num} {self.config['code_name']}" in art[0]:
-                            with open(save_path, 'x', encoding="utf-8") as f:
-                                f.write(art[0])
-                            messagebox.showinfo("Succès", f"Article {art_num} converti : {save_path}")
-                            break
-            elif self.choice.get() == "split":
-                output_dir = filedialog.askdirectory(title="Choisir le dossier de sortie")
-                if output_dir:
-                    full_markdown = self.converter.convert_full_document(self.xml_file)
-                    pattern = (self.filename_pattern.get()
-                               .replace("{prefix}", self.config['article_prefix'])
-                               .replace("{code}", self.config['code_name']))
-                    count, failed = self.converter.split_from_full_markdown(full_markdown, Path(output_dir), pattern)
-                    rapport = f"{count} articles enregistrés.\n"
-                    if failed:
-                        rapport += "Échecs sur :\n" + "\n".join(failed)
-                    messagebox.showinfo("Rapport", rapport)
+            results.put(job())
         except FileExistsError:
-            messagebox.showerror("Erreur", "Le fichier existe déjà, conversion annulée.")
+            results.put(("error", "Erreur", "Le fichier existe déjà, conversion annulée."))
         except Exception as e:
-            messagebox.showerror("Erreur", str(e))
+            results.put(("error", "Erreur", str(e)))
+
+    def _poll_job(self, results: "queue.Queue[Tuple[str, str, str]]") -> None:
+        try:
+            level, title, message = results.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self._poll_job, results)
+            return
+        self.run_button.config(state="normal")
+        if level == "error":
+            messagebox.showerror(title, message)
+        else:
+            messagebox.showinfo(title, message)
 
 
 if __name__ == "__main__":
@@ -20,6 +20,26 @@ CONFIG = {
 AKN_NS = 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0'
 FEDLEX_NS = 'http://www.fedlex.admin.ch/eli/cc/27/317_321_377/fr'
 
+# Namespace-qualified tag names, built once instead of on every lookup.
+AKN_NUM = f'{{{AKN_NS}}}num'
+AKN_P = f'{{{AKN_NS}}}p'
+AKN_AUTH = f'{{{AKN_NS}}}authorialNote'
+AKN_BLOCKLIST = f'{{{AKN_NS}}}blockList'
+AKN_LISTINTRO = f'{{{AKN_NS}}}listIntroduction'
+AKN_ITEM = f'{{{AKN_NS}}}item'
+AKN_PARAGRAPH = f'{{{AKN_NS}}}paragraph'
+AKN_CONTENT = f'{{{AKN_NS}}}content'
+AKN_HEADING = f'{{{AKN_NS}}}heading'
+AKN_LEVEL = f'{{{AKN_NS}}}level'
+AKN_ARTICLE = f'{{{AKN_NS}}}article'
+
+# Descendant search paths, likewise built once.
+AKN_NUM_PATH = f'.//{AKN_NUM}'
+AKN_HEADING_PATH = f'.//{AKN_HEADING}'
+AKN_PARAGRAPH_PATH = f'.//{AKN_PARAGRAPH}'
+AKN_CONTENT_PATH = f'.//{AKN_CONTENT}'
+AKN_ARTICLE_PATH = f'.//{AKN_ARTICLE}'
+
 class SwissCodeConverter:
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or CONFIG.copy()
@@ -33,7 +53,7 @@ class SwissCodeConverter:
         return tree.getroot()
 
     def extract_article_number(self, article_element: ET.Element) -> str:
-        num_element = article_element.find(f'.//{{{AKN_NS}}}num')
+        num_element = article_element.find(AKN_NUM_PATH)
         if num_element is not None:
             num_text = ''.join(num_element.itertext()).strip()
             match = re.search(r'(\d+[a-z]?)', num_text)
@@ -45,8 +65,8 @@ class SwissCodeConverter:
         hierarchy = []
         current = article_element
         while current is not None:
-            if current.tag == f'{{{AKN_NS}}}level':
-                heading = current.find(f'.//{{{AKN_NS}}}heading', namespaces=self.ns)
+            if current.tag == AKN_LEVEL:
+                heading = current.find(AKN_HEADING_PATH, namespaces=self.ns)
                 if heading is not None and heading.text:
                     text = heading.text.strip()
                     if any(keyword in text for keyword in ["Titre final", "Dispositions finales", "Dispositions transitoires"]):
@@ -55,86 +75,89 @@ class SwissCodeConverter:
             current = current.getparent()
         return self.config['margin_separator'].join(hierarchy) if hierarchy else ""
 
-    def extract_paragraphs(self, article_element: ET.Element) -> List[Tuple[str, str, Dict[str, str], int]]:
+    def extract_paragraphs(self, article_element: ET.Element) -> Tuple[List[Tuple[str, str, int]], Dict[str, str]]:
         """Extrait paragraphes et listes numérotées avec gestion des notes d’auteur."""
         paragraphs = []
+        all_notes: Dict[str, str] = {}
 
         def parse_content(content_element, para_num="", level=0):
             # Cas 1 : content contient un blockList (listIntroduction + items)
-            blocklist = content_element.find(f'{{{AKN_NS}}}blockList')
+            blocklist = content_element.find(AKN_BLOCKLIST)
             if blocklist is not None:
                 # Ajoute l'intro de la liste s'il y a
-                list_intro = blocklist.find(f'{{{AKN_NS}}}listIntroduction')
+                list_intro = blocklist.find(AKN_LISTINTRO)
                 if list_intro is not None and list_intro.text:
                     intro_text = list_intro.text.strip()
                     if intro_text:
-                        paragraphs.append((para_num, intro_text, {}, level))
+                        paragraphs.append((para_num, intro_text, level))
                 # Ajoute chaque item de la liste
-                for item in blocklist.findall(f'{{{AKN_NS}}}item'):
-                    item_num_elem = item.find(f'{{{AKN_NS}}}num')
+                for item in blocklist.findall(AKN_ITEM):
+                    item_num_elem = item.find(AKN_NUM)
                     item_num = item_num_elem.text.strip() if item_num_elem is not None and item_num_elem.text else ""
-                    item_p = item.find(f'{{{AKN_NS}}}p')
-                    notes = {}
-                    item_text = ""
+                    item_p = item.find(AKN_P)
+                    note_count = 0
+                    item_parts: List[str] = []
                     if item_p is not None:
+                        authorial_nodes = set()
+                        for an in item_p.iter(AKN_AUTH):
+                            authorial_nodes.update(an.iterdescendants())
                         for node in item_p.iter():
-                            in_authorial = any(
-                                ancestor.tag == f'{{{AKN_NS}}}authorialNote'
-                                for ancestor in node.iterancestors()
-                            )
-                            if node.tag == f'{{{AKN_NS}}}authorialNote':
-                                note_num = node.get("num", str(len(notes) + 1))
-                                note_text = ' '.join(node.itertext()).strip()
-                                notes[note_num] = note_text
-                                item_text += f"<sup style='color:red'>[{note_num}]</sup>"
+                            in_authorial = node in authorial_nodes
+                            if node.tag == AKN_AUTH:
+                                note_count += 1
+                                note_num = node.get("num", str(note_count))
+                                all_notes[note_num] = ' '.join(node.itertext()).strip()
+                                item_parts.append(f"<sup style='color:red'>[{note_num}]</sup>")
                                 if node.tail:
-                                    item_text += node.tail.strip() + " "
+                                    item_parts.append(node.tail.strip() + " ")
                             elif node is item_p:
                                 if node.text and not in_authorial:
-                                    item_text += node.text.strip() + " "
+                                    item_parts.append(node.text.strip() + " ")
                             else:
                                 if node.tail and not in_authorial:
-                                    item_text += node.tail.strip() + " "
-                    paragraphs.append((item_num, item_text.strip(), notes, level + 1))
+                                    item_parts.append(node.tail.strip() + " ")
+                    item_text = "".join(item_parts).strip()
+                    paragraphs.append((item_num, item_text, level + 1))
             else:
                 # Cas 2 : paragraphes simples (ou <content> direct)
-                for p in content_element.findall(f'./{{{AKN_NS}}}p'):
-                    notes = {}
-                    para_text = ""
+                for p in content_element.findall(AKN_P):
+                    note_count = 0
+                    para_parts: List[str] = []
+                    authorial_nodes = set()
+                    for an in p.iter(AKN_AUTH):
+                        authorial_nodes.update(an.iterdescendants())
                     for node in p.iter():
-                        in_authorial = any(
-                            ancestor.tag == f'{{{AKN_NS}}}authorialNote'
-                            for ancestor in node.iterancestors()
-                        )
-                        if node.tag == f'{{{AKN_NS}}}authorialNote':
-                            note_num = node.get("num", str(len(notes) + 1))
-                            note_text = ' '.join(node.itertext()).strip()
-                            notes[note_num] = note_text
-                            para_text += f"<sup style='color:red'>[{note_num}]</sup>"
+                        in_authorial = node in authorial_nodes
+                        if node.tag == AKN_AUTH:
+                            note_count += 1
+                            note_num = node.get("num", str(note_count))
+                            all_notes[note_num] = ' '.join(node.itertext()).strip()
+                            para_parts.append(f"<sup style='color:red'>[{note_num}]</sup>")
                             if node.tail:
-                                para_text += node.tail.strip() + " "
+                                para_parts.append(node.tail.strip() + " ")
                         elif node is p:
                             if node.text and not in_authorial:
-                                para_text += node.text.strip() + " "
+                                para_parts.append(node.text.strip() + " ")
                         else:
                             if node.tail and not in_authorial:
-                                para_text += node.tail.strip() + " "
-                    if para_text.strip():
-                        paragraphs.append((para_num, para_text.strip(), notes, level))
+                                para_parts.append(node.tail.strip() + " ")
+                    para_text = "".join(para_parts).strip()
+                    if para_text:
+                        paragraphs.append((para_num, para_text, level))
 
-        for para in article_element.findall(f'.//{{{AKN_NS}}}paragraph'):
-            num_element = para.find(f'.//{{{AKN_NS}}}num')
+        for para in article_element.findall(AKN_PARAGRAPH_PATH):
+            num_element = para.find(AKN_NUM_PATH)
             para_num = num_element.text.strip() if num_element is not None and num_element.text else ""
-            content_element = para.find(f'.//{{{AKN_NS}}}content')
+            content_element = para.find(AKN_CONTENT_PATH)
             if content_element is not None:
                 parse_content(content_element, para_num, level=0)
 
-        return paragraphs
+        return paragraphs, all_notes
 
     def format_article_markdown(self, article_number: str, marginal_notes: str,
-                                paragraphs: List[Tuple[str, str, Dict[str, str], int]]) -> str:
+                                paragraphs: List[Tuple[str, str, int]],
+                                all_notes: Dict[str, str]) -> str:
         markdown_lines: List[str] = []
-        all_notes: Dict[str, str] = {}
         prefix = "SupArt." if self.in_final_section else self.config['article_prefix']
         code = self.config['code_name']
 
@@ -147,7 +170,7 @@ class SwissCodeConverter:
             markdown_lines.append(f"[{marginal_notes}]")
         markdown_lines.append("")
 
-        for para_num, para_text, notes, level in paragraphs:
+        for para_num, para_text, level in paragraphs:
             if para_num:
                 colored_num = f'<span style="color:yellow"><small>{para_num}</small></span>'
                 indent = "   " * level
@@ -156,7 +179,6 @@ class SwissCodeConverter:
                 indent = "   " * level
                 line = f"{indent}{para_text}"
             markdown_lines.append(line)
-            all_notes.update(notes)
 
         if all_notes:
             markdown_lines.append("")
@@ -171,12 +193,12 @@ class SwissCodeConverter:
     def convert_article(self, article_element: ET.Element) -> str:
         article_number = self.extract_article_number(article_element)
         marginal_notes = self.extract_marginal_notes(article_element)
-        paragraphs = self.extract_paragraphs(article_element)
-        return self.format_article_markdown(article_number, marginal_notes, paragraphs)
+        paragraphs, all_notes = self.extract_paragraphs(article_element)
+        return self.format_article_markdown(article_number, marginal_notes, paragraphs, all_notes)
 
     def convert_full_document(self, xml_file_path: Union[str, Path], output_file_path: Optional[Union[str, Path]] = None) -> str:
         root = self.parse_xml(xml_file_path)
-        articles = root.findall(f'.//{{{AKN_NS}}}article')
+        articles = root.findall(AKN_ARTICLE_PATH)
         if not articles:
             raise ValueError("No articles found in the XML document")
         markdown_content: List[str] = []